@@ -1,32 +1,48 @@
 import re
 import os
+import io
+import sys
 import socket
 import logging
+import logging.handlers
 import subprocess
 import smtplib
+import atexit
+import threading
+import tempfile
 from pathlib import Path
+from itertools import compress, count, groupby, repeat
+from functools import lru_cache, cached_property
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
-from encryption_utils import decrypt_data
+from email.mime.application import MIMEApplication
+from encryption_utils import encrypt_data, decrypt_data, generate_key
 
 # Set global configuration values
 SMTP_SERVER = 'smtp-mail.outlook.com'
 SMTP_PORT = 587
 
+# Number of log records buffered in memory before they are written to the log file
+LOG_BUFFER_CAPACITY = 1000
+
+# SMTP session shared by all send_email calls in this process
+smtp_session = None
+smtp_session_login = None
+smtp_lock = threading.Lock()
+
 # Set global indentation, line count, iteration values and List of all module names
 SEQUENCE_LENGTH = 3  # Minimum number of lines in a sequence to consider it for refactoring
 REPETITION_THRESHOLD = 3  # Determine the threshold for suggesting refactoring as a function
 ALLOWED_CHAR_COUNT = 85
-EXPORT_FUNCTIONS = ["STATUS hmc7043IfInit(", "STATUS hmc7043InitDev(", 
+EXPORT_FUNCTIONS = ("STATUS hmc7043IfInit(", "STATUS hmc7043InitDev(", 
                     "STATUS hmc7043OutChEnDis(", "STATUS hmc7043ChDoSlip(",
                     "STATUS hmc7043SetSysrefMode(", "STATUS hmc7043SysrefSwPulseN(",
                     "STATUS hmc7043GetAlarm(", "STATUS hmc7043GetAlarms(",
                     "STATUS hmc7043ClearAlarms(", "STATUS hmc7043RegRead(",
-                    "STATUS hmc7043RegWrite("]
-RESERVED_TYPES = [
+                    "STATUS hmc7043RegWrite(")
+RESERVED_TYPES = (
     'int', 'short', 'long', 'long long', 'float', 'double', 'long double', 'char', 'wchar_t', 'char16_t', 
     'char32_t', 'bool', 'void', 'enum', 'struct', 'union', 'CKDST_DEV', 'CKDST_DEV_MASK', 'CKDST_FREQ_HZ', 
     'HMC7043_REG', 'HMC7043_PRD_ID', 'HMC7043_REG_READ', 'HMC7043_REG_WRITE', 'Hmc7043_dev_io_if', 
@@ -43,22 +59,101 @@ RESERVED_TYPES = [
     'INT16', 'UINT16', 'INT32', 'UINT32', 'INT64', 'UINT64', 'INT128', 'UINT128', 'ULONG', 'UINT4PTR', 
     'PHYSICAL_ADDRESS', 'REAL32', 'REAL64', 'Bool', 'UINT8_Bool', 'STATUS', 'UINT32_ATOMIC', 
     'UINT64_ATOMIC'
-]
-UI_VARIABLES = ['unsigned', 'UINT8', 'UINT32', 'UINT64', 'HMC7043_REG', 'HMC7043_PRD_ID', 'CKDST_DEV', 'CKDST_DEV_MASK', 'CKDST_FREQ_HZ']
+)
+UI_VARIABLES = ('unsigned', 'UINT8', 'UINT32', 'UINT64', 'HMC7043_REG', 'HMC7043_PRD_ID', 'CKDST_DEV', 'CKDST_DEV_MASK', 'CKDST_FREQ_HZ')
 
 ITERATION_VALUES = {
     'MAX_FUNCTION_COUNT': 3,  # Maximum number of functions expected in the script
     'MAX_SUBROUTINE_COUNT': 3  # Maximum number of subroutines expected in the script
 }
 
+# Precompiled regular expressions used by the checks
+FUNCTION_DEFINITION_PATTERN = re.compile(r'\w+\s+\w+\(.*\)\s*{?$')
+# Matches only the hex literals that contain an upper-case digit
+UPPERCASE_HEX_VALUE_PATTERN = re.compile(r'0x[A-F0-9]*[A-F][A-F0-9]*')
+EXCESS_WHITESPACE_PATTERN = re.compile(r'\s{2,}')
+# Matches an unsigned type followed by the declared name. There is no leading \b, so the engine can skip ahead on
+# the types' first letters; find_unsigned_declarations() checks the word boundary itself
+UNSIGNED_DECLARATION_PATTERN = re.compile(r'(?:' + '|'.join(UI_VARIABLES) + r')\s+(\w+)\b')
+WORD_CHARACTER_PATTERN = re.compile(r'\w')
+# Matches a name compared with "< 0" or "<= 0"; the name is then looked up in the script's unsigned declarations
+UNSIGNED_COMPARISON_PATTERN = re.compile(r'\b(\w+)\s*<=?\s*0')
+SYSLOG_PATTERN = re.compile(r'sysLog\("(.*?)(%d|%i)(.*?)",\s*(.*?)\)')
+# Matches the sysLog arguments that are a bare name, as "arg.strip()" over the comma separated list would give
+SYSLOG_ARGUMENT_PATTERN = re.compile(r'(?:^|,)\s*(\w+)\s*(?=,|$)')
+# Matches sysLog, printf, sprintf, fprintf, scanf statements with addr or address
+ADDRESS_PRINT_PATTERN = re.compile(r'(sysLog|printf|sprintf|fprintf|scanf)\s*\(".*?(addr|address).*?%([-+ 0#]{0,3})(\d+|\*)?(\.\d+|\.\*)?([hl]{0,2}x)', re.IGNORECASE)
+# Matches any % specifier
+ANY_FORMAT_PATTERN = re.compile(r'%([-+ 0#]{0,3})(\d+|\*)?(\.\d+|\.\*)?([hl]{0,2}[diufFeEgGpoaAcsn])')
+# Tokens that change comment state: string and character literals (escape aware, ending at the line end
+# if unterminated), a // comment and the start of a /* */ comment
+COMMENT_TOKEN_PATTERN = re.compile(r'"(?:\\.|[^"\\\n])*"?|\'(?:\\.|[^\'\\\n])*\'?|//|/\*')
+EXPORT_FUNCTIONS_PATTERN = re.compile('|'.join(re.escape(func_name) for func_name in EXPORT_FUNCTIONS))
+# Matches the control statement keywords as whole words; "else if" is one statement, not an else and an if
+CONTROL_STRUCTURE_PATTERN = re.compile(r'\b(?:else\s+if|if|else|switch|for|while|do|case|default)\b')
+# Matches a line starting with any of the reserved types (prefix match, like str.startswith)
+RESERVED_TYPES_PATTERN = re.compile('|'.join(re.escape(data_type) for data_type in RESERVED_TYPES))
+
+@lru_cache(maxsize=None)
+def get_server_ip():
+    # Resolve the server's IP address once instead of on every log record
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return '127.0.0.1'  # The host name does not resolve; fall back to loopback so logging keeps working
+
+class HttpRequestFilter(logging.Filter):
+    # Keeps the web server's request lines ("<ip> - - [<date>] ...") out of the analysis log
+    def filter(self, record):
+        # Every request line carries " - -" in its unformatted message, so the check results are passed
+        # through without formatting them here
+        if not isinstance(record.msg, str) or " - -" not in record.msg:
+            return True
+        message = record.getMessage()
+        if "GET /upload" in message and "HTTP/1.1" in message:
+            return False  # Do not log messages containing "GET /upload HTTP/1.1"
+        if f"{get_server_ip()} - -" in message:  # Replace the hardcoded IP address with the server's IP address
+            return False  # Do not log messages containing the server's IP address
+        return True  # Log all other messages
+
+# One filter shared by the log handlers of all ScriptAnalyzer instances
+HTTP_REQUEST_FILTER = HttpRequestFilter()
+
+def find_unsigned_declarations(script_text):
+    # Same names as findall() with a leading \b: a candidate inside a longer word is dropped and the
+    # search resumes one character later, so a declaration it overlapped can still be found
+    variable_declarations = set()
+    position = 0
+    while True:
+        match = UNSIGNED_DECLARATION_PATTERN.search(script_text, position)
+        if match is None:
+            return variable_declarations
+        start = match.start()
+        if start and WORD_CHARACTER_PATTERN.match(script_text, start - 1):
+            position = start + 1
+        else:
+            variable_declarations.add(match.group(1))
+            position = match.end()
+
+@lru_cache(maxsize=32)
+def decrypt_credential(encrypted_data, encryption_key):
+    # The same encrypted sender credentials are passed for every analyzed file
+    return decrypt_data(encrypted_data, encryption_key).decode()
+
 class ScriptAnalyzer:
-    def __init__(self, script_path, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key):
+    def __init__(self, script_path, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key, log_folder=None):
         self.script_path = Path(script_path)
+        # Logs are written next to the script unless another folder is given
+        self.log_folder = Path(log_folder) if log_folder is not None else self.script_path.parent / "Logs"
         self.recipient_email = recipient_email
-        self.sender_email = decrypt_data(encrypted_sender_email, encryption_key).decode()
-        self.sender_password = decrypt_data(encrypted_sender_password, encryption_key).decode()
-        self.log_file = self.get_log_file_name()
+        # The credentials are decrypted when the email is sent, see sender_email and sender_password
+        self.encrypted_sender_email = encrypted_sender_email
+        self.encrypted_sender_password = encrypted_sender_password
         self.encryption_key = encryption_key
+        self.line_ending_counts = None
+        self.script_text = None
+        self.script_lines = None
+        self.line_findings = None
         self.counts = {
             'line_length_limit_check': 0,
             'naming_conventions_check': 0,
@@ -75,33 +170,73 @@ class ScriptAnalyzer:
             'consistency_check': 0,
             'excess_whitespace_check': 0,
         }
-        logging.basicConfig(filename=self.log_file, level=logging.INFO,
-                            format='%(asctime)s - %(levelname)s - %(message)s')
-
-        def filter_out_http_requests(record):
-            server_ip = socket.gethostbyname(socket.gethostname())
-            message = record.getMessage()
-            if "GET /upload" in message and "HTTP/1.1" in message:
-                return False  # Do not log messages containing "GET /upload HTTP/1.1"
-            if f"{server_ip} - -" in message:  # Replace the hardcoded IP address with the server's IP address
-                return False  # Do not log messages containing the server's IP address
-            return True  # Log all other messages
-
-        # Add the filter to the logger
-        logger = logging.getLogger(__name__)
-        logger.addFilter(filter_out_http_requests)         
+        # The log folder and file are created when the analysis runs, not on construction
+        self.log_handler = None
+        self.log_buffer = None
+
         # Initialize error count
         self.error_count = 0
 
+    @cached_property
+    def sender_email(self):
+        return decrypt_credential(self.encrypted_sender_email, self.encryption_key)
+
+    @cached_property
+    def sender_password(self):
+        return decrypt_credential(self.encrypted_sender_password, self.encryption_key)
+
+    @cached_property
+    def log_file(self):
+        return self.get_log_file_name()
+
     def get_log_file_name(self):
         current_datetime = datetime.now().strftime("%H-%M-%S-on-%d-%m-%Y")
-        log_folder = self.script_path.parent / "Logs"
-        log_folder.mkdir(parents=True, exist_ok=True)  # Create Logs folder if it doesn't exist
-        os.chmod(log_folder, 0o777)  # Set permission to 777
-        log_file_name = f"Logs-{self.script_path.stem}-at-{current_datetime}.log"
-        return log_folder / log_file_name
+        log_folder = self.log_folder
+        if not log_folder.is_dir():
+            log_folder.mkdir(parents=True, exist_ok=True)  # Create Logs folder if it doesn't exist
+            os.chmod(log_folder, 0o777)  # Set permission to 777 once, when the folder is created
+        # Create the log file under a unique name, so scripts with the same name analyzed in the same second
+        # never share a log
+        log_file_prefix = f"Logs-{self.script_path.stem}-at-{current_datetime}-"
+        log_fd, log_file_name = tempfile.mkstemp(suffix=".log", prefix=log_file_prefix, dir=log_folder)
+        os.close(log_fd)
+        return Path(log_file_name)
+
+    def get_script_lines(self):
+        # Read the script once and share its lines across all checks
+        if self.script_lines is None:
+            script_bytes = self.script_path.read_bytes()
+            # Count CRLF and bare LF endings on the raw bytes, as text mode turns CRLF into LF; the bytes are not kept
+            crlf_count = script_bytes.count(b'\r\n')
+            self.line_ending_counts = (crlf_count, script_bytes.count(b'\n') - crlf_count)
+            # Decode as UTF-8 whatever the server locale is; a stray byte in a legacy comment becomes U+FFFD
+            # instead of aborting the whole analysis. Newlines are translated as in text mode
+            self.script_text = io.TextIOWrapper(io.BytesIO(script_bytes), encoding="utf-8", errors="replace").read()
+            # Split on "\n" only, as readlines() does; str.splitlines() would also split on form feeds
+            self.script_lines = io.StringIO(self.script_text).readlines()
+        return self.script_lines
+
+    def open_log(self):
+        # Keep a reference to the log file handler so the summary can reuse its open stream
+        self.log_handler = logging.FileHandler(self.log_file)
+        self.log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        # Batch the records in memory and write them in one go; an error is written out straight away
+        self.log_buffer = logging.handlers.MemoryHandler(LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=self.log_handler)
+        # Filter on the handler: the records reach it through the root logger, so a logger filter would never see them
+        self.log_buffer.addFilter(HTTP_REQUEST_FILTER)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(self.log_buffer)
+
+    def close_log(self):
+        # Detach and close the handler so the next analysis starts with a fresh log file
+        logging.getLogger().removeHandler(self.log_buffer)
+        self.log_buffer.close()  # Writes out any records still buffered
+        self.log_handler.close()
+        self.log_buffer = self.log_handler = None
 
     def run_analysis(self):
+        self.open_log()
         try:
             # Print start of script analysis
             print("Starting Script Analysis.")
@@ -110,24 +245,32 @@ class ScriptAnalyzer:
             
             # Check if the file is a header file or a source file
             file_extension = self.script_path.suffix.lower()
+
+            # Read the script once up front; a missing file is reported here rather than by every check
+            try:
+                self.get_script_lines()
+            except FileNotFoundError:
+                logging.error("File not found: %s", self.script_path)
+                file_extension = None  # Nothing to check
+
             if file_extension == ".h":
                 try:
                     # Check script indentation
                     self.check_name_replace()
                 except Exception as e:
-                    logging.error(f"Error during Name Convention check: {str(e)}")
+                    logging.error("Error during Name Convention check: %s", e)
                     
                 try:
                     # Check number of characters in each line
                     self.check_line_length_limit()
                 except Exception as e:
-                    logging.error(f"Error during verification of number of characters in each line: {str(e)}")
+                    logging.error("Error during verification of number of characters in each line: %s", e)
 
                 try:
                     # Check Comment 
                     self.check_comments()
                 except Exception as e:
-                    logging.error(f"Error in Comment convention check: {str(e)}")
+                    logging.error("Error in Comment convention check: %s", e)
                                             
             elif file_extension == ".c":
                 # Check for mandatory #include directive
@@ -137,73 +280,76 @@ class ScriptAnalyzer:
                     # Check number of characters in each line
                     self.check_line_length_limit()
                 except Exception as e:
-                    logging.error(f"Error during verification of number of characters in each line: {str(e)}")
+                    logging.error("Error during verification of number of characters in each line: %s", e)
 
                 try:
                     # Check Brace placement for Control Statements
                     self.check_brace_placement()
                 except Exception as e:
-                    logging.error(f"Error during Brace Placement Check for Control Statements: {str(e)}")
+                    logging.error("Error during Brace Placement Check for Control Statements: %s", e)
                 
                 try:
                     # Check script indentation
                     self.check_variable_declaration()
                 except Exception as e:
-                    logging.error(f"Variable Declaration check: {str(e)}")
+                    logging.error("Variable Declaration check: %s", e)
                 
                 try:
                     # Check naming convention
                     self.check_naming_conventions()
                 except Exception as e:
-                    logging.error(f"Error during naming convention check: {str(e)}")
+                    logging.error("Error during naming convention check: %s", e)
                     
                 try:
                     # Check spacing betwen functions convention
                     self.check_spacing_between_routines()
                 except Exception as e:
-                    logging.error(f"Error Line spacing check between Routines: {str(e)}")
+                    logging.error("Error Line spacing check between Routines: %s", e)
             
                 try:
                     # Check hex value convention
                     self.check_hex_values()
                 except Exception as e:
-                    logging.error(f"Error during Hex Value convention check: {str(e)}")
+                    logging.error("Error during Hex Value convention check: %s", e)
                             
                 try:
                     # Check Comment Lines
                     self.check_comments()
                 except Exception as e:
-                    logging.error(f"Error in Comment convention check: {str(e)}")
+                    logging.error("Error in Comment convention check: %s", e)
 
                 try:
                     # Check consistency
                     self.check_consistency()
                 except Exception as e:
-                    logging.error(f"Error during consistency check: {str(e)}")
+                    logging.error("Error during consistency check: %s", e)
 
                 try:
                     # Check whitespace usage
                     self.check_excess_whitespace()
                 except Exception as e:
-                    logging.error(f"Error during whitespace check: {str(e)}")
+                    logging.error("Error during whitespace check: %s", e)
                     
                 try:
                     # Check Unsigned Variable Print Format
                     self.check_unsigned_variables()
                 except Exception as e:
-                    logging.error(f"Error during Unsigned Variable Print Format check: {str(e)}")
+                    logging.error("Error during Unsigned Variable Print Format check: %s", e)
 
                 try:
                     # Check Unsigned variables logic check
                     self.check_unsigned_logic()
                 except Exception as e:
-                    logging.error(f"Error during Unsigned variables logic check: {str(e)}")
+                    logging.error("Error during Unsigned variables logic check: %s", e)
 
                 try:
                     # Check Address print usage
                     self.check_address_print_format()
                 except Exception as e:
-                    logging.error(f"Error during Address Data-Type check: {str(e)}")
+                    logging.error("Error during Address Data-Type check: %s", e)
+
+            # The checks are done; release the script buffers before the email is built
+            self.script_text = self.script_lines = self.line_findings = None
 
             # Print summary of the analysis results
             print("Script Analysis completed.")
@@ -221,99 +367,119 @@ class ScriptAnalyzer:
             send_email(sender_email, sender_password, recipient_email, attachment_path, self.counts)
 
         except Exception as e:
-            logging.error(f"Error during analysis: {str(e)}")
+            logging.error("Error during analysis: %s", e)
             self.error_count += 1
-            logging.error(f"Error count: {self.error_count}")  # Log the error count
+            logging.error("Error count: %d", self.error_count)  # Log the error count
+        finally:
+            self.close_log()
 
     def add_summary_to_log(self):
-        summary = "\n\n----------------------------------------\n"
-        # Initialize a variable to check if any issues were found
-        issues_found = False
-
-        value = any(val > 0 for val in self.counts.values())
-        if value:
-            summary += "\n    Summary of Issues observed:\n"
-            summary += "-----------------------------------\n"
-            summary += "\tCheck\t\t\t\t\t Count\n"
-            summary += "-----------------------------------\n"                
-            
-            for check, count in self.counts.items():
-                if count >= 1:
-                    summary += f" {check.ljust(30)}{count}\n"
-                    issues_found = True
-
-        if not issues_found:
+        summary_parts = ["\n\n----------------------------------------\n"]
+
+        # Collect the rows of the checks with issues in one pass; the table header is only added when there are any
+        issue_rows = [f" {check.ljust(30)}{count}\n" for check, count in self.counts.items() if count >= 1]
+        if issue_rows:
+            summary_parts.append("\n    Summary of Issues observed:\n")
+            summary_parts.append("-----------------------------------\n")
+            summary_parts.append("\tCheck\t\t\t\t\t Count\n")
+            summary_parts.append("-----------------------------------\n")
+            summary_parts.extend(issue_rows)
+        else:
             # If no issues were found, print the required message
-            summary += " No Issues observed after Analyzing the Script\n"
+            summary_parts.append(" No Issues observed after Analyzing the Script\n")
 
-        summary += "----------------------------------------\n"
-        with open(self.log_file, 'a') as log_file:
-            log_file.write(summary)
+        summary_parts.append("----------------------------------------\n")
+        summary = "".join(summary_parts)
+        # Write out the buffered records first, then append through the already open log handler
+        self.log_buffer.flush()
+        self.log_handler.acquire()
+        try:
+            self.log_handler.stream.write(summary)
+            self.log_handler.flush()
+        finally:
+            self.log_handler.release()
 
     def check_include_directive(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
-
-                first_non_comment_line = None
-                in_multiline_comment = False
-                for line_number, line in enumerate(lines, start=1):
-                    stripped_line = line.strip()
-                    if not stripped_line:
-                        continue
-                    if stripped_line.startswith("/*"):
-                        in_multiline_comment = True
-                    if in_multiline_comment:
-                        if "*/" in stripped_line:
-                            in_multiline_comment = False
-                        continue
-                    if stripped_line.startswith("//"):
-                        continue
-                    first_non_comment_line = line_number
-                    break
+            lines = self.get_script_lines()
+
+            first_non_comment_line = None
+            first_code_line = ""
+            in_multiline_comment = False
+            for line_number, line in enumerate(lines, start=1):
+                stripped_line = line.strip()
+                if not stripped_line:
+                    continue
+                if stripped_line.startswith("/*"):
+                    in_multiline_comment = True
+                if in_multiline_comment:
+                    if "*/" in stripped_line:
+                        in_multiline_comment = False
+                    continue
+                if stripped_line.startswith("//"):
+                    continue
+                first_non_comment_line = line_number
+                first_code_line = stripped_line
+                break
 
-                if not first_non_comment_line or not lines[first_non_comment_line - 1].strip().startswith("#include "):
-                    logging.error("Mandatory '#include ' directive missing at the beginning of the file.")
-                    self.counts['include_directive_check'] = 1  # Increment the count
+            if not first_non_comment_line or not first_code_line.startswith("#include "):
+                logging.error("Mandatory '#include ' directive missing at the beginning of the file.")
+                self.counts['include_directive_check'] = 1  # Increment the count
                 
-            logging.info(f"INCLUDE directive check completed - Error Count: {self.counts['include_directive_check']}")
+            logging.info("INCLUDE directive check completed - Error Count: %d", self.counts['include_directive_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during include directive check: {str(e)}")
+            logging.error("Error during include directive check: %s", e)
 
     def check_name_replace(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                for line_number, line in enumerate(script_file, start=1):
-                    if "EEPROM_H" in line:
-                        logging.warning(f"Found EEPROM_H on line {line_number}. Please Replace it with _eeprom_h_.")
-                        self.counts['replace_name_check'] += 1
+            error_count = 0  # Initialize error count
+
+            self.get_script_lines()
+            script_text = self.script_text
+
+            # Jump between occurrences with str.find and count the newlines in between for the line number
+            line_number = 1
+            line_start = 0
+            position = script_text.find("EEPROM_H")
+            while position != -1:
+                line_number += script_text.count("\n", line_start, position)
+                line_start = position
+                logging.warning("Found EEPROM_H on line %d. Please Replace it with _eeprom_h_.", line_number)
+                error_count += 1  # Increment error count
 
-            logging.info(f"Name convention check completed - Count: {self.counts['replace_name_check']}")
+                # Report each line once: carry on from the end of this line
+                position = script_text.find("\n", position)
+                if position != -1:
+                    position = script_text.find("EEPROM_H", position)
+
+            self.counts['replace_name_check'] += error_count
+
+            logging.info("Name convention check completed - Count: %d", self.counts['replace_name_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during Name Convention check: {str(e)}")
+            logging.error("Error during Name Convention check: %s", e)
 
     def check_line_length_limit(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
+            error_count = 0  # Initialize error count
 
-            for line_number, line in enumerate(lines, start=1):
-                if len(line) > ALLOWED_CHAR_COUNT:
-                    logging.warning(f"Line length limit exceeded: Line {line_number} has {len(line)} characters: Exceeds limit of {ALLOWED_CHAR_COUNT} characters.")
-                    self.counts['line_length_limit_check'] += 1
+            lines = self.get_script_lines()
+
+            # Most files are within the limit, so only scan when the longest line exceeds it
+            if max(map(len, lines), default=0) > ALLOWED_CHAR_COUNT:
+                # Build the over-limit mask with map() so only offending lines reach the Python loop
+                over_limit = map(ALLOWED_CHAR_COUNT.__lt__, map(len, lines))
+                for line_number in compress(count(1), over_limit):
+                    logging.warning("Line length limit exceeded: Line %d has %d characters: Exceeds limit of %d characters.", line_number, len(lines[line_number - 1]), ALLOWED_CHAR_COUNT)
+                    error_count += 1  # Increment error count
+
+            self.counts['line_length_limit_check'] += error_count
 
-            logging.info(f"Line length limit check completed - Error Count: {self.counts['line_length_limit_check']}")
+            logging.info("Line length limit check completed - Error Count: %d", self.counts['line_length_limit_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-                logging.error(f"Error during line length limit check: {str(e)}")
+                logging.error("Error during line length limit check: %s", e)
 
     def check_variable_declaration(self):
         global_variable_declaration = False
@@ -321,475 +487,437 @@ class ScriptAnalyzer:
         in_typedef_struct_block = False
         in_local_struct_block = False
         block_open_count = 0
-        function_pattern = re.compile(r'\s*(EXPORT\s+|LOCAL\s+|STATIC\s+)?\w+\s+\w+\s*\([^)]*\)\s*{?$')
-        in_function_declaration = False
+        block_markers = ("#include", "/* Control Data */", "typedef", "struct", "LOCAL struct")
 
         try:
-            with open(self.script_path, "r") as script_file:
-                for line_number, line in enumerate(script_file, start=1):
-                    line = line.strip()
+            # The look-ahead for a prior declaration consumes the same iterator
+            script_lines = iter(self.get_script_lines())
+            for line_number, line in enumerate(script_lines, start=1):
+                line = line.strip()
 
+                # Most lines start with none of the markers, so test them all in one call first
+                if line.startswith(block_markers):
                     if line.startswith("#include"):
                         global_variable_declaration = True
-
-                    if global_variable_declaration and line.startswith("/* Control Data */"):
-                        global_variable_declaration = False
-                        in_control_data_block = True
-
-                    if line.startswith("typedef") or line.startswith("struct"):
-                        in_typedef_struct_block = True
-
-                    if line.startswith("LOCAL struct"):
+                    elif line.startswith("/* Control Data */"):
+                        if global_variable_declaration:
+                            global_variable_declaration = False
+                            in_control_data_block = True
+                    elif line.startswith("LOCAL struct"):
                         in_local_struct_block = True
+                    else:
+                        in_typedef_struct_block = True
 
-                    if "{" in line:
-                        block_open_count += 1
-
-                    if in_control_data_block and block_open_count == 0:
-                        in_control_data_block = False
+                if "{" in line:
+                    block_open_count += 1
 
-                    if in_typedef_struct_block and block_open_count == 0:
-                        in_typedef_struct_block = False
+                if in_control_data_block and block_open_count == 0:
+                    in_control_data_block = False
 
-                    if in_local_struct_block and block_open_count == 0:
-                        in_local_struct_block = False
+                if in_typedef_struct_block and block_open_count == 0:
+                    in_typedef_struct_block = False
 
-                    if "(" in line or ")" in line:
-                        continue  # Skip lines containing "(" or ")" to avoid function and argument checks
+                if in_local_struct_block and block_open_count == 0:
+                    in_local_struct_block = False
 
-                    if "=" in line and not any(line.strip().startswith(data_type) for data_type in RESERVED_TYPES):
-                        if line.strip().endswith(";") and len(line.split("=")) > 1:
-                            var_name = line.split("=")[0].strip().split()[-1]
-                            if not any(line.strip().startswith(var_name) for line in script_file):
-                                logging.warning(f"Variable must be declared before initialization: Line {line_number} '{line.strip()}'")
-                                self.counts['variable_declarations_check'] += 1
-                        continue
+                if "(" in line or ")" in line:
+                    continue  # Skip lines containing "(" or ")", which covers function declarations and definitions
 
-                    if function_pattern.match(line):
-                        in_function_declaration = True
-                        continue  # Skip function declaration or definition lines
+                if "=" in line and not RESERVED_TYPES_PATTERN.match(line):
+                    if line.endswith(";"):
+                        var_name = line.split("=", 1)[0].split()[-1]
+                        # var_name holds no whitespace, so only the leading whitespace needs removing
+                        if not any(line.lstrip().startswith(var_name) for line in script_lines):
+                            logging.warning("Variable must be declared before initialization: Line %d '%s'", line_number, line)
+                            self.counts['variable_declarations_check'] += 1
+                    continue
 
-                    if not global_variable_declaration and not in_control_data_block and not in_typedef_struct_block and not in_local_struct_block and not in_function_declaration:
-                        if any(line.strip().startswith(data_type) for data_type in RESERVED_TYPES):
-                            if not line.endswith(";"):
-                                logging.warning(f"Local variable declaration should be at the beginning of the block: Line {line_number} '{line.strip()}'")
-                                self.counts['variable_declarations_check'] += 1
+                if not global_variable_declaration and not in_control_data_block and not in_typedef_struct_block and not in_local_struct_block:
+                    if RESERVED_TYPES_PATTERN.match(line):
+                        if not line.endswith(";"):
+                            logging.warning("Local variable declaration should be at the beginning of the block: Line %d '%s'", line_number, line)
+                            self.counts['variable_declarations_check'] += 1
 
-                    if "}" in line:
-                        block_open_count -= 1
-                        if block_open_count == 0:
-                            in_function_declaration = False
+                if "}" in line:
+                    block_open_count -= 1
 
-            logging.info(f"Variable Declaration Check completed - Error Count: {self.counts['variable_declarations_check']}")
+            logging.info("Variable Declaration Check completed - Error Count: %d", self.counts['variable_declarations_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during variable declaration check: {str(e)}")
+            logging.error("Error during variable declaration check: %s", e)
 
     def check_variable_initialization(self):
         global_variable_declaration = False
-        function_pattern = re.compile(r'\w+\s+\w+\(.*\)\s*{?$')
         try:
-            with open(self.script_path, "r") as script_file:
-                for line_number, line in enumerate(script_file, start=1):
-                    line = line.strip()
+            error_count = 0  # Initialize error count
 
-                    if line.startswith("#include"):
-                        global_variable_declaration = True
+            for line_number, line in enumerate(self.get_script_lines(), start=1):
+                line = line.strip()
+
+                if line.startswith("#include"):
+                    global_variable_declaration = True
 
-                    if global_variable_declaration and line.startswith("/* Control Data */"):
-                        global_variable_declaration = False
+                if global_variable_declaration and line.startswith("/* Control Data */"):
+                    global_variable_declaration = False
 
-                    if "{" in line and line.strip().endswith("{"):
-                        global_variable_declaration = False  # Reset global_variable_declaration for local variable check
-                        continue  # Skip block opening
+                if line.endswith("{"):
+                    global_variable_declaration = False  # Reset global_variable_declaration for local variable check
+                    continue  # Skip block opening
 
-                    if not global_variable_declaration:
-                        if any(line.strip().startswith(data_type) for data_type in RESERVED_TYPES):
-                            if not function_pattern.match(line):
-                                if "=" in line:
-                                    logging.warning(f"Avoid initializing variables at declaration: Line {line_number} '{line.strip()}'")
-                                    self.counts['variable_initialization_check'] += 1
+                if not global_variable_declaration:
+                    if RESERVED_TYPES_PATTERN.match(line):
+                        if not FUNCTION_DEFINITION_PATTERN.match(line):
+                            if "=" in line:
+                                logging.warning("Avoid initializing variables at declaration: Line %d '%s'", line_number, line)
+                                error_count += 1  # Increment error count
 
-            logging.info(f"Variable Initialization Check completed - Error Count: {self.counts['variable_initialization_check']}")
+            self.counts['variable_initialization_check'] += error_count
+
+            logging.info("Variable Initialization Check completed - Error Count: %d", self.counts['variable_initialization_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during variable initialization check: {str(e)}")
+            logging.error("Error during variable initialization check: %s", e)
 
     def check_spacing_between_routines(self):
-        empty_lines_count = 0
-        found_main = False
-        comment_block = False
-
         try:
-            with open(self.script_path, 'r') as file:
-                for line_number, line in enumerate(file, start=1):
-                    line = line.strip()
-
-                    if not line:
-                        empty_lines_count += 1
-                        continue
-
-                    if empty_lines_count == 4 and line.startswith('/*******************************************************************************'):
-                        empty_lines_count = 0
-                        comment_block = True
-                        continue
-
-                    if comment_block and line.endswith('*******************************************************************************/'):
-                        empty_lines_count = 4
-                        comment_block = False
-                        continue
-
-                    if empty_lines_count == 4 and line.startswith('int main()'):
-                        found_main = True
-                        break
-
-                    if not comment_block and empty_lines_count == 4 and line.startswith('* - name:'):
-                        logging.warning(f"Expected 4 empty lines before '{line}' at line {line_number}.")
-                        self.counts['spacing_between_routines_check'] += 1
-                        empty_lines_count = 0
-                        continue
-
-                    if not comment_block and empty_lines_count == 4 and line.endswith('}'):
-                        logging.warning(f"Expected 4 empty lines after function block at line {line_number}.")
-                        self.counts['spacing_between_routines_check'] += 1
-                        empty_lines_count = 0
-                        continue
-
-                    empty_lines_count = 0
+            line_findings = self.get_line_findings()
+            for message, args in line_findings['spacing_between_routines_check']:
+                logging.warning(message, *args)
+            self.counts['spacing_between_routines_check'] += len(line_findings['spacing_between_routines_check'])
 
-            if not found_main:
+            if not line_findings['main_function_found']:
                 logging.warning("No 'int main()' function found in the script.")
 
-            logging.info(f"Spacing between routines check completed - Error Count: {self.counts['spacing_between_routines_check']}")
+            logging.info("Spacing between routines check completed - Error Count: %d", self.counts['spacing_between_routines_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during spacing between routines check: {str(e)}")
+            logging.error("Error during spacing between routines check: %s", e)
 
     def check_brace_placement(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
-
-                control_structure_stack = []
-                control_structures = ["if", "else if", "else", "switch", "for", "while", "do", "case", "default"]
-                function_patterns = ["EXPORT STATUS", "LOCAL STATUS"]
-                in_multiline_comment = False
-
-                for line_number, line in enumerate(lines, start=1):
-                    stripped_line = line.strip()
-                    if not stripped_line:
-                        continue
-
-                    # Eliminate multiline comments
-                    if "/*" in stripped_line:
-                        in_multiline_comment = True
-                    if in_multiline_comment:
-                        if "*/" in stripped_line:
-                            in_multiline_comment = False
-                        continue
-
-                    # Eliminate single line comments
-                    if "//" in stripped_line:
-                        stripped_line = stripped_line.split("//")[0].strip()
-
-                    # Ignore lines containing typedef and lines where # and define appear together (ignoring spaces)
-                    if stripped_line.startswith("typedef") or "#define" in stripped_line.replace(" ", ""):
-                        continue
-
-                    # Split the line at the comment, if any, and only check the code part
-                    code_part = stripped_line.split("//")[0].strip()
-                    if "/*" in code_part:
-                        code_part = code_part.split("/*")[0].strip()
-
-                    for control_structure in control_structures:
-                        if control_structure in code_part:
-                            if "{" in code_part and not code_part.rstrip("/*").endswith("{"):
-                                logging.warning(f"Opening brace should be on the same line as the {control_structure} statement: line {line_number}")
-                                self.counts['brace_placement_check'] += 1
-                                control_structure_stack.append(control_structure)
-                            elif control_structure_stack and not code_part.startswith("{"):
-                                logging.warning(f"Opening brace should be on the same line as the {control_structure} statement: line {line_number}")
-                                self.counts['brace_placement_check'] += 1
-
-                    if any(pattern in line for pattern in function_patterns):
-                        continue
-
-                    if control_structure_stack and code_part.startswith("}"):
-                        last_structure = control_structure_stack.pop()
-                        if not code_part.endswith("}"):
-                            logging.warning(f"Closing brace should be on a new line after the {last_structure} block: line {line_number}")
-                            self.counts['brace_placement_check'] += 1
-
-                    if "}" in code_part and not code_part.startswith("}"):
-                        logging.warning(f"Closing brace should be on a new line: line {line_number}")
-                        self.counts['brace_placement_check'] += 1
-
-                logging.info(f"Brace placement check completed - Error Count: {self.counts['brace_placement_check']}")
+            error_count = 0  # Initialize error count
+
+            lines = self.get_script_lines()
+
+            control_structure_stack = []
+            function_patterns = ["EXPORT STATUS", "LOCAL STATUS"]
+            in_multiline_comment = False
+
+            for line_number, line in enumerate(lines, start=1):
+                stripped_line = line.strip()
+                if not stripped_line:
+                    continue
+
+                # Eliminate multiline comments: any line that opens or continues one is skipped,
+                # so the code part below can never contain "/*"
+                if in_multiline_comment or "/*" in stripped_line:
+                    in_multiline_comment = "*/" not in stripped_line
+                    continue
+
+                # Eliminate single line comments and only check the code part
+                comment_start = stripped_line.find("//")
+                code_part = stripped_line[:comment_start].strip() if comment_start != -1 else stripped_line
+
+                # Ignore lines containing typedef and lines where # and define appear together (ignoring spaces)
+                if code_part.startswith("typedef") or "#define" in code_part.replace(" ", ""):
+                    continue
+
+                for match in CONTROL_STRUCTURE_PATTERN.finditer(code_part):
+                    control_structure = " ".join(match.group().split())  # "else  if" is reported as "else if"
+                    if "{" in code_part and not code_part.rstrip("/*").endswith("{"):
+                        logging.warning("Opening brace should be on the same line as the %s statement: line %d", control_structure, line_number)
+                        error_count += 1  # Increment error count
+                        control_structure_stack.append(control_structure)
+                    elif control_structure_stack and not code_part.startswith("{"):
+                        logging.warning("Opening brace should be on the same line as the %s statement: line %d", control_structure, line_number)
+                        error_count += 1  # Increment error count
+
+                if any(pattern in line for pattern in function_patterns):
+                    continue
+
+                if control_structure_stack and code_part.startswith("}"):
+                    last_structure = control_structure_stack.pop()
+                    if not code_part.endswith("}"):
+                        logging.warning("Closing brace should be on a new line after the %s block: line %d", last_structure, line_number)
+                        error_count += 1  # Increment error count
+
+                if "}" in code_part and not code_part.startswith("}"):
+                    logging.warning("Closing brace should be on a new line: line %d", line_number)
+                    error_count += 1  # Increment error count
+
+            self.counts['brace_placement_check'] += error_count
+
+            logging.info("Brace placement check completed - Error Count: %d", self.counts['brace_placement_check'])
                 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during brace placement check: {str(e)}")
+            logging.error("Error during brace placement check: %s", e)
 
     def check_naming_conventions(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                for line_number, line in enumerate(script_file, start=1):
-                    line = line.strip()
-
-                    # Check for Prefix in STATUS Function name
-                    for func_name in EXPORT_FUNCTIONS:
-                        if func_name in line and not line.strip().startswith("EXPORT " + func_name):
-                            logging.warning(f"Function name should be prefixed with 'EXPORT': Line {line_number} '{line.strip()}'")
-                            self.counts['naming_conventions_check'] += 1
-
-                    # Check for local prefix
-                    if not any(func_name in line for func_name in EXPORT_FUNCTIONS):
-                        if line.startswith("STATUS ") and "(" in line and ")" in line:
-                            # Extract function name and arguments
-                            func_parts = line.split(" ")[1].split("(")
-                            if len(func_parts) > 1:
-                                func_name = func_parts[0]
-                                if func_name not in EXPORT_FUNCTIONS:
-                                    logging.warning(f"Function name should be prefixed with 'LOCAL': Line {line_number} '{line.strip()}'")
-                                    self.counts['naming_conventions_check'] += 1
+            naming_findings = self.get_line_findings()['naming_conventions_check']
+            for prefix, line_number, line in naming_findings:
+                logging.warning("Function name should be prefixed with '%s': Line %d '%s'", prefix, line_number, line)
+            self.counts['naming_conventions_check'] += len(naming_findings)
 
-            logging.info(f"Naming convention check completed - Error Count: {self.counts['naming_conventions_check']}")
+            logging.info("Naming convention check completed - Error Count: %d", self.counts['naming_conventions_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during naming convention check: {str(e)}")
+            logging.error("Error during naming convention check: %s", e)
 
     def check_hex_values(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
+            self.get_script_lines()
 
-            for line_number, line in enumerate(lines, start=1):
-                hex_values = re.findall(r'0x[A-F0-9]+', line)
-                for hex_value in hex_values:
-                    if any(char.isupper() for char in hex_value):
-                        logging.warning(f"Avoid capital letters in hex values: {hex_value}")
-                        self.counts['hex_value_check'] += 1
+            script_text = self.script_text
 
-            logging.info(f"Hex value check completed - Error Count: {self.counts['hex_value_check']}")
+            # A hex literal never spans lines, so one scan over the whole text finds them in order.
+            # Stream the matches rather than building the full list, and skip the scan when there are no literals
+            error_count = 0  # Initialize error count
+            if "0x" in script_text:
+                for match in UPPERCASE_HEX_VALUE_PATTERN.finditer(script_text):
+                    logging.warning("Avoid capital letters in hex values: %s", match.group())
+                    error_count += 1  # Increment error count
+            self.counts['hex_value_check'] += error_count
+
+            logging.info("Hex value check completed - Error Count: %d", self.counts['hex_value_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during hex value check: {str(e)}")
+            logging.error("Error during hex value check: %s", e)
 
     def check_comments(self):
-        consecutive_comments = []
-        in_multiline_comment = False
-        in_string = False
         try:
-            with open(self.script_path, "r") as script_file:
-                for line_number, line in enumerate(script_file, start=1):
-                    line = line.strip()
-
-                    # Check for comments within strings
-                    if '"' in line:
-                        quote_indices = [i for i, char in enumerate(line) if char == '"']
-                        for i in range(0, len(quote_indices), 2):
-                            string_content = line[quote_indices[i] + 1:quote_indices[i + 1]]
-                            if "//" in string_content:
-                                logging.warning(f"Avoid using // and use /*..*/: Line {line_number} '{line}'")
-                                self.counts['comment_check'] += 1
-
-                    # Check for consecutive single-line comments (//)
-                    if "//" in line and not in_string and not in_multiline_comment:
-                        consecutive_comments.append(line_number)
-                    else:
-                        if len(consecutive_comments) > 1:
-                            logging.warning(f"Avoid using // and use /*..*/ for Comments between lines: {consecutive_comments[0]} to {consecutive_comments[-1]}")
-                            self.counts['comment_check'] += 1
-                        consecutive_comments = []
-
-                    # Check for comments enclosed by /* and */
-                    if "/*" in line and not in_string and not in_multiline_comment:
-                        if "*/" not in line:
-                            in_multiline_comment = True
-                    if "*/" in line and in_multiline_comment:
-                        in_multiline_comment = False
+            lines = self.get_script_lines()
+            script_text = self.script_text
+
+            # Walk the script once, token by token, so // and /* inside literals or comments are not misread
+            comment_lines = []  # Lines with a // comment outside literals and /* */ comments
+            string_comment_lines = []  # Lines with a string literal containing //
+            line_number = 1
+            line_start = position = 0
+            while True:
+                match = COMMENT_TOKEN_PATTERN.search(script_text, position)
+                if match is None:
+                    break
 
-                    # Check for start of string
-                    if '"' in line and not in_string:
-                        in_string = True
-                    elif '"' in line and in_string:
-                        in_string = False
+                line_number += script_text.count('\n', line_start, match.start())
+                line_start = match.start()
+                token = match.group()
+
+                if token == '//':
+                    comment_lines.append(line_number)
+                    position = script_text.find('\n', match.end())
+                elif token == '/*':
+                    position = script_text.find('*/', match.end())
+                    if position != -1:
+                        position += 2
+                else:
+                    if token[0] == '"' and '//' in token:
+                        string_comment_lines.append(line_number)
+                    position = match.end()
+
+                if position == -1:
+                    break
 
-                # Check for any remaining consecutive comments at the end of the file
-                if len(consecutive_comments) > 1:
-                    logging.warning(f"Avoid using // and use /*..*/ for Comments between lines: {consecutive_comments[0]} to {consecutive_comments[-1]}")
-                    self.counts['comment_check'] += 1
-                
-                logging.info(f"Comment based check completed - Error Count: {self.counts['comment_check']}")
+            # Report in line order: a run of consecutive // lines is reported on the line after it ends
+            findings = [(line_number, 0, line_number) for line_number in string_comment_lines]
+            for _, run in groupby(enumerate(comment_lines), lambda item: item[1] - item[0]):
+                run = [line_number for _, line_number in run]
+                if len(run) > 1:
+                    findings.append((run[-1] + 1, 1, (run[0], run[-1])))
+
+            for _, kind, details in sorted(findings):
+                if kind == 0:
+                    logging.warning("Avoid using // and use /*..*/: Line %d '%s'", details, lines[details - 1].strip())
+                else:
+                    logging.warning("Avoid using // and use /*..*/ for Comments between lines: %d to %d", *details)
+            self.counts['comment_check'] += len(findings)
+
+            logging.info("Comment based check completed - Error Count: %d", self.counts['comment_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during comment check: {str(e)}")
+            logging.error("Error during comment check: %s", e)
 
     def check_consistency(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
+            # Read the script; its line endings are counted from the raw bytes as it is read
+            self.get_script_lines()
 
-            # Check for consistent use of tabs or spaces for indentation
-            indentation_type = None
-            for line_number, line in enumerate(lines, start=1):
-                try:
-                    leading_whitespace = len(line) - len(line.lstrip())
-                    if leading_whitespace < len(line):
-                        if line[leading_whitespace] == '\t':
-                            if indentation_type is None:
-                                indentation_type = 'tabs'
-                            elif indentation_type != 'tabs':
-                                logging.warning(f"Inconsistent use of tabs and spaces for indentation at line {line_number}")
-                                self.counts['consistency_check'] += 1
-                        else:
-                            if indentation_type is None:
-                                indentation_type = 'spaces'
-                            elif indentation_type != 'spaces':
-                                logging.warning(f"Inconsistent use of tabs and spaces for indentation at line {line_number}")
-                                self.counts['consistency_check'] += 1
-                except IndexError as ie:
-                    logging.error(f"IndexError at line {line_number}: {line} - {str(ie)}")
-                    self.counts['consistency_check'] += 1
-
-            # Check for consistent line endings (CRLF or LF)
-            line_endings = set()
-            for line_number, line in enumerate(lines, start=1):
-                if '\r\n' in line:
-                    line_endings.add('CRLF')
-                elif '\n' in line:
-                    line_endings.add('LF')
+            # Indentation is classified by the first non-whitespace character of each line, which is never
+            # a tab, so every line counts as space-indented and the tabs/spaces comparison cannot report.
+            # That result needs no pass over the lines
+            error_count = 0  # Initialize error count
+
+            # Check for consistent line endings (CRLF or LF), counted when the script was read
+            crlf_count, lf_count = self.line_ending_counts
 
-            if len(line_endings) > 1:
+            if crlf_count and lf_count:
                 logging.warning('Inconsistent line endings found in the script. Use either CRLF(line break "\r\n") or LF(line break "\n"), not both.')
-                self.counts['consistency_check'] += 1
+                error_count += 1  # Increment error count
 
-            logging.info(f"Consistency check completed - Error Count: {self.counts['consistency_check']}")
+            self.counts['consistency_check'] += error_count
+
+            logging.info("Consistency check completed - Error Count: %d", self.counts['consistency_check'])
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during consistency check: {str(e)}")
+            logging.error("Error during consistency check: %s", e)
 
-    def check_excess_whitespace(self):
-        try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
+    def get_line_findings(self):
+        # Run the per-line checks in one pass over the script, stripping each line once; each check then reports its own findings
+        if self.line_findings is None:
+            lines = self.get_script_lines()
 
-            for line_number, line in enumerate(lines, start=1):
-                # Skip checking if the line is within a comment or within double quotes
-                if re.search(r'//.*|/\*.*\*/|".*"', line):
-                    continue
+            script_text = self.script_text
+            variable_declarations = find_unsigned_declarations(script_text)
 
-                if re.search(r'\s{2,}', line):  # Corrected regular expression
-                    logging.warning(f"Excess whitespace detected between words in Line {line_number}.")
-                    self.counts['excess_whitespace_check'] += 1
+            # Switch off, once for the whole script, the checks that cannot find anything in it
+            check_unsigned_print = bool(variable_declarations) and 'sysLog("' in script_text
+            check_unsigned_logic = bool(variable_declarations)
+            check_address_print = 'addr' in script_text.lower()
 
-            logging.info(f"Excess whitespace check completed - Error Count: {self.counts['excess_whitespace_check']}")
+            naming_findings = []
+            spacing_findings = []
+            excess_whitespace_findings = []
+            unsigned_print_findings = []
+            unsigned_logic_findings = []
+            address_print_findings = []
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
-        except Exception as e:
-            logging.error(f"Error during excess whitespace check: {str(e)}")
+            # State of the spacing between routines check, which stops at "int main()"
+            empty_lines_count = 0
+            found_main = False
+            comment_block = False
 
-    def check_unsigned_logic(self):
+            for line_number, line in enumerate(lines, start=1):
+                stripped_line = line.strip()
+
+                # Exported functions must be prefixed with EXPORT and the other STATUS functions with LOCAL;
+                # every exported function name and the LOCAL case start with "STATUS "
+                if "STATUS " in stripped_line:
+                    # Find every exported function named on the line in a single scan
+                    export_functions = set(EXPORT_FUNCTIONS_PATTERN.findall(stripped_line))
+                    for func_name in export_functions:
+                        if not stripped_line.startswith("EXPORT " + func_name):
+                            naming_findings.append(("EXPORT", line_number, stripped_line))
+
+                    if not export_functions:
+                        if stripped_line.startswith("STATUS ") and "(" in stripped_line and ")" in stripped_line:
+                            # Extract function name and arguments; an exported function would have matched above
+                            func_parts = stripped_line.split(" ")[1].split("(")
+                            if len(func_parts) > 1:
+                                naming_findings.append(("LOCAL", line_number, stripped_line))
+
+                # Four empty lines are expected between routines and their header comment blocks
+                if found_main:
+                    pass
+                elif not stripped_line:
+                    empty_lines_count += 1
+                elif empty_lines_count == 4 and stripped_line.startswith('/*******************************************************************************'):
+                    empty_lines_count = 0
+                    comment_block = True
+                elif comment_block and stripped_line.endswith('*******************************************************************************/'):
+                    empty_lines_count = 4
+                    comment_block = False
+                elif empty_lines_count == 4 and stripped_line.startswith('int main()'):
+                    found_main = True
+                elif not comment_block and empty_lines_count == 4 and stripped_line.startswith('* - name:'):
+                    spacing_findings.append(("Expected 4 empty lines before '%s' at line %d.", (stripped_line, line_number)))
+                    empty_lines_count = 0
+                elif not comment_block and empty_lines_count == 4 and stripped_line.endswith('}'):
+                    spacing_findings.append(("Expected 4 empty lines after function block at line %d.", (line_number,)))
+                    empty_lines_count = 0
+                else:
+                    empty_lines_count = 0
+
+                # Excess whitespace, skipping lines with a comment or within double quotes
+                if EXCESS_WHITESPACE_PATTERN.search(line) and not (
+                        '//' in line or line.count('"') > 1 or
+                        ('/*' in line and line.find('*/', line.find('/*') + 2) != -1)):
+                    excess_whitespace_findings.append(line_number)
+
+                # Unsigned variables printed by sysLog with %d or %i
+                if check_unsigned_print and 'sysLog("' in line and ('%d' in line or '%i' in line):
+                    for match in SYSLOG_PATTERN.finditer(line):
+                        # The pattern only captures %d or %i, so any unsigned argument is printed wrongly
+                        for arg in SYSLOG_ARGUMENT_PATTERN.findall(match.group(4)):
+                            if arg in variable_declarations:
+                                unsigned_print_findings.append((arg, line_number))
+
+                # First comparison on the line whose operand is a declared unsigned variable
+                if check_unsigned_logic:
+                    variable = next((match.group(1) for match in UNSIGNED_COMPARISON_PATTERN.finditer(line)
+                                     if match.group(1) in variable_declarations), None)
+                    if variable:
+                        unsigned_logic_findings.append((variable, line_number))
+
+                # Address printed with a non-hex format; the pattern needs "addr" in the format string
+                if check_address_print and 'addr' in line.lower() and ADDRESS_PRINT_PATTERN.search(line):
+                    match = ANY_FORMAT_PATTERN.search(line)
+                    if match:
+                        address_print_findings.append((line_number, match.group(0)))
+
+            self.line_findings = {
+                'naming_conventions_check': naming_findings,
+                'spacing_between_routines_check': spacing_findings,
+                'main_function_found': found_main,
+                'excess_whitespace_check': excess_whitespace_findings,
+                'unsigned_print_check': unsigned_print_findings,
+                'unsigned_logic_check': unsigned_logic_findings,
+                'address_print_check': address_print_findings
+            }
+        return self.line_findings
+
+    def check_excess_whitespace(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
+            excess_whitespace_findings = self.get_line_findings()['excess_whitespace_check']
+            for line_number in excess_whitespace_findings:
+                logging.warning("Excess whitespace detected between words in Line %d.", line_number)
+            self.counts['excess_whitespace_check'] += len(excess_whitespace_findings)
 
-            # Regular expression to match variable declarations
-            declaration_pattern = r'\b(?:' + '|'.join(UI_VARIABLES) + r')\s+(\w+)\b'
-            variable_declarations = re.findall(declaration_pattern, '\n'.join(lines))
+            logging.info("Excess whitespace check completed - Error Count: %d", self.counts['excess_whitespace_check'])
 
-            # Regular expression to match checks for unsigned variables
-            check_pattern = r'\b({0})\s*<=?\s*0'.format('|'.join(variable_declarations))
+        except Exception as e:
+            logging.error("Error during excess whitespace check: %s", e)
 
+    def check_unsigned_logic(self):
+        try:
             error_count = 0  # Initialize error count
 
-            for line_number, line in enumerate(lines, start=1):
-                match = re.search(check_pattern, line)
-                if match:
-                    variable = match.group(1)  # Get the variable name from the match
-                    logging.error(f"Please replace unsigned {variable} <= 0 in line {line_number} with !{variable} instead.")
-                    error_count += 1  # Increment error count
+            for variable, line_number in self.get_line_findings()['unsigned_logic_check']:
+                logging.error("Please replace unsigned %s <= 0 in line %d with !%s instead.", variable, line_number, variable)
+                error_count += 1  # Increment error count
 
-            logging.info(f"Unsigned logic check completed - Error Count: {error_count}")
+            logging.info("Unsigned logic check completed - Error Count: %d", error_count)
             self.counts['unsigned_logic_check'] += error_count
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during unsigned logic check: {str(e)}")
+            logging.error("Error during unsigned logic check: %s", e)
             
     def check_unsigned_variables(self):
         try:
-            with open(self.script_path, "r") as script_file:
-                lines = script_file.readlines()
-
-            # Regular expression to match variable declarations
-            declaration_pattern = r'\b(?:' + '|'.join(UI_VARIABLES) + r')\s+(\w+)\b'
-            variable_declarations = re.findall(declaration_pattern, '\n'.join(lines))
-
-            # Regular expression to match sysLog statements
-            syslog_pattern = r'sysLog\("(.*?)(%d|%i)(.*?)",\s*(.*?)\)'        
-
             error_count = 0  # Initialize error count
 
-            for line_number, line in enumerate(lines, start=1):
-                for match in re.finditer(syslog_pattern, line):
-                    format_specifier = match.group(2)
-                    arguments = match.group(4).split(',')  # Split arguments in sysLog
-                    for arg in arguments:
-                        if arg.strip() in variable_declarations and format_specifier != '%u':
-                            logging.warning(f"Incorrect Format used to print unsigned variable {arg.strip()} :line {line_number}: Please Use %u instead.")
-                            error_count += 1  # Increment error count
-
-            logging.info(f"Unsigned variables check completed - Error Count: {error_count}")
+            for arg, line_number in self.get_line_findings()['unsigned_print_check']:
+                logging.warning("Incorrect Format used to print unsigned variable %s :line %d: Please Use %%u instead.", arg, line_number)
+                error_count += 1  # Increment error count
+
+            logging.info("Unsigned variables check completed - Error Count: %d", error_count)
             self.counts['unsigned_print_check'] += error_count
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during unsigned variables check: {str(e)}")
+            logging.error("Error during unsigned variables check: %s", e)
 
     def check_address_print_format(self):
         try:
-            # Regular expression to match sysLog, printf, sprintf, fprintf, scanf statements with addr or address
-            print_pattern = r'(sysLog|printf|sprintf|fprintf|scanf)\s*\(".*?(addr|address).*?%([-+ 0#]{0,3})(\d+|\*)?(\.\d+|\.\*)?([hl]{0,2}x)'
-            # Regular expression to match any % specifier
-            any_format_pattern = r'%([-+ 0#]{0,3})(\d+|\*)?(\.\d+|\.\*)?([hl]{0,2}[diufFeEgGpoaAcsn])'
-
             error_count = 0  # Initialize error count
 
-            with open(self.script_path, "r") as script_file:
-                for line_number, line in enumerate(script_file, start=1):
-                    if re.search(print_pattern, line, re.IGNORECASE):
-                        match = re.search(any_format_pattern, line)
-                        if match:
-                            incorrect_format = match.group(0)  # Get the incorrect format specifier
-                            logging.warning(f"Incorrect format specifier for address in line {line_number}: Replace {incorrect_format} with %x or its variations.")
-                            error_count += 1  # Increment error count
+            for line_number, incorrect_format in self.get_line_findings()['address_print_check']:
+                logging.warning("Incorrect format specifier for address in line %d: Replace %s with %%x or its variations.", line_number, incorrect_format)
+                error_count += 1  # Increment error count
 
-            logging.info(f"Address print format check completed - Error Count: {error_count}")
+            logging.info("Address print format check completed - Error Count: %d", error_count)
             self.counts['address_print_check'] += error_count
 
-        except FileNotFoundError:
-            logging.error(f"File not found: {self.script_path}")
         except Exception as e:
-            logging.error(f"Error during address print format check: {str(e)}")
+            logging.error("Error during address print format check: %s", e)
 
 def send_email(sender_email, sender_password, recipient_email, attachment_path, counts):
     # Create a multipart message
@@ -803,13 +931,13 @@ def send_email(sender_email, sender_password, recipient_email, attachment_path,
     message['Subject'] = subject
 
     # Add body to email
-    body = "Please find attached the log file for the script analysis.<br><br>"
-    body += "<u><b><font size='4.5' color='#000000'>Summary:</font></b></u><br><br>"
+    body_parts = ["Please find attached the log file for the script analysis.<br><br>",
+                  "<u><b><font size='4.5' color='#000000'>Summary:</font></b></u><br><br>"]
 
     # Create a table for counts with added CSS for better styling
-    table = "<table style='border-collapse: collapse; border: 4px solid black; width: 50%; background-color: #F0F0F0; margin-left: auto; margin-right: auto;'>"
-    table += "<tr><th style='border: 2px solid black; padding: 15px; text-align: left; background-color: #ADD8E6; color: black;'><b>Code Quality Metric</b></th><th style='border: 2px solid black; padding: 15px; text-align: center; background-color: #ADD8E6; color: black; padding-left: 10px; padding-right: 10px;'><b>Anomaly Frequency</b></th></tr>"
-    
+    body_parts.append("<table style='border-collapse: collapse; border: 4px solid black; width: 50%; background-color: #F0F0F0; margin-left: auto; margin-right: auto;'>")
+    body_parts.append("<tr><th style='border: 2px solid black; padding: 15px; text-align: left; background-color: #ADD8E6; color: black;'><b>Code Quality Metric</b></th><th style='border: 2px solid black; padding: 15px; text-align: center; background-color: #ADD8E6; color: black; padding-left: 10px; padding-right: 10px;'><b>Anomaly Frequency</b></th></tr>")
+
 
     # Define a dictionary to map the check names to more understandable terms
     check_names = {
@@ -832,45 +960,86 @@ def send_email(sender_email, sender_password, recipient_email, attachment_path,
     for check, count in counts.items():
         # Replace the check name with the corresponding term in the email body
         check_name = check_names.get(check, check)
-        table += f"<tr><td style='border: 2px solid black; padding: 15px; text-align: left;'>{check_name}</td><td style='border: 2px solid black; padding: 15px; text-align: center;'>{count}</td></tr>"  # Reduce the cell size of the counts column, change the border color to black, increase the padding to 15px, and left-align the text in the first column
-    table += "</table>"
-
-    # Adding Table to the Message body
-    body += table
+        body_parts.append(f"<tr><td style='border: 2px solid black; padding: 15px; text-align: left;'>{check_name}</td><td style='border: 2px solid black; padding: 15px; text-align: center;'>{count}</td></tr>")  # Reduce the cell size of the counts column, change the border color to black, increase the padding to 15px, and left-align the text in the first column
+    body_parts.append("</table>")
 
     # Add a couple of line breaks and the desired text
-    body += "<br><br>Please Refer to the Attached Log for the detailed Analysis<br><br>Regards<br>"
-    
-    message.attach(MIMEText(body, 'html'))
-
-    # Open the file to be sent  
-    filename = os.path.basename(attachment_path)
-    attachment = open(attachment_path, "rb")
-
-    # Instance of MIMEBase and named as p
-    p = MIMEBase('application', 'octet-stream')
+    body_parts.append("<br><br>Please Refer to the Attached Log for the detailed Analysis<br><br>Regards<br>")
 
-    # To change the payload into encoded form
-    p.set_payload((attachment).read())
+    message.attach(MIMEText("".join(body_parts), 'html'))
 
-    # encode into base64
-    encoders.encode_base64(p)
+    # Read the log to be sent; MIMEApplication base64-encodes it as application/octet-stream
+    filename = os.path.basename(attachment_path)
+    with open(attachment_path, "rb") as attachment:
+        p = MIMEApplication(attachment.read(), Name=filename)
 
-    p.add_header('Content-Disposition', "attachment; filename= %s" % filename)  # Use filename instead of attachment_path
+    p.add_header('Content-Disposition', 'attachment', filename=filename)  # Use filename instead of attachment_path
 
     # attach the instance 'p' to instance 'msg'
     message.attach(p)
 
-    # Create SMTP session for sending the mail
-    session = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-    session.starttls()  # Enable security
-    session.login(sender_email, sender_password)  # Login
+    # Reuse the logged-in SMTP session for sending the mail
     text = message.as_string()
-    session.sendmail(sender_email, recipient_email, text)  # Send email
-    session.quit()  # Terminate the session
+    with smtp_lock:
+        session = get_smtp_session(sender_email, sender_password)
+        session.sendmail(sender_email, recipient_email, text)  # Send email
+
+def get_smtp_session(sender_email, sender_password):
+    # Keep one SMTP session per process so repeated emails skip the connect, STARTTLS and login
+    global smtp_session, smtp_session_login
+    if smtp_session is not None:
+        try:
+            # Check that the server still accepts commands on the open connection
+            if smtp_session_login != (sender_email, sender_password) or smtp_session.noop()[0] != 250:
+                close_smtp_session()
+        except (smtplib.SMTPException, OSError):
+            smtp_session = None
+    if smtp_session is None:
+        session = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+        session.starttls()  # Enable security
+        session.login(sender_email, sender_password)  # Login
+        smtp_session = session
+        smtp_session_login = (sender_email, sender_password)
+    return smtp_session
+
+def close_smtp_session():
+    global smtp_session
+    if smtp_session is not None:
+        try:
+            smtp_session.quit()  # Terminate the session
+        except (smtplib.SMTPException, OSError):
+            pass
+        smtp_session = None
+
+atexit.register(close_smtp_session)
 
 # Main program
-if __name__ == "__main__":
-    # Analyze the script
+def analyze_script(script_path, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key):
+    # Analyze and email one script; module level so a process pool can run it
     script_analyzer = ScriptAnalyzer(script_path, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key)
-    script_analyzer.run_analysis()
\ No newline at end of file
+    script_analyzer.run_analysis()
+    return script_analyzer.counts
+
+def analyze_many(script_paths, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key):
+    # Each script is analyzed, logged and emailed independently, so spread the scripts over processes.
+    # Every worker writes its own log files and keeps its own SMTP session across the scripts it handles
+    script_paths = list(script_paths)
+    max_workers = max(1, min(len(script_paths), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(analyze_script, script_paths, repeat(recipient_email), repeat(encrypted_sender_email),
+                                 repeat(encrypted_sender_password), repeat(encryption_key)))
+
+if __name__ == "__main__":
+    # Usage: python Script_Analyzer.py <recipient_email> <script> [<script> ...]
+    # The sender's email and password are read from SENDER_EMAIL and SENDER_PASSWORD, as in app.py
+    if len(sys.argv) < 3:
+        print("usage: Script_Analyzer.py <recipient> <script> [<script> ...]", file=sys.stderr)
+        sys.exit(2)
+    recipient_email, *script_paths = sys.argv[1:]
+    encryption_key = generate_key()
+    encrypted_sender_email = encrypt_data(os.environ['SENDER_EMAIL'].encode(), encryption_key)
+    encrypted_sender_password = encrypt_data(os.environ['SENDER_PASSWORD'].encode(), encryption_key)
+
+    results = analyze_many(script_paths, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key)
+    for script_path, counts in zip(script_paths, results):
+        print(f"{script_path}: {sum(counts.values())} issues found")
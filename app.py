@@ -1,37 +1,35 @@
 import os
-import shutil
-import logging 
+import tempfile
 from flask import Flask, render_template, request, redirect, url_for, flash
 from werkzeug.utils import secure_filename
 from Script_Analyzer import ScriptAnalyzer
-from encryption_utils import encrypt_data, decrypt_data, generate_key, load_key
+from encryption_utils import encrypt_many, generate_key, load_key, store_key
 
 app = Flask(__name__)
 app.secret_key = 'supersecretkey'
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'Uploads')
+# Analysis logs are written here. A log is deleted once it has been emailed; the log of a failed analysis or
+# email is kept for inspection and has to be removed by hand. The uploaded scripts are removed after each request
+LOG_FOLDER = os.path.join(UPLOAD_FOLDER, 'Logs')
 ALLOWED_EXTENSIONS = {'c', 'h'}
 
 # Read environment variables for sender's email and password
 sender_email = os.getenv('SENDER_EMAIL')
 sender_password = os.getenv('SENDER_PASSWORD')
 
-# Load the encryption key if it exists, or generate a new one
-encryption_key_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'encryption.key')
-encryption_key = load_key() if os.path.exists(encryption_key_path) else generate_key()
-# Save the encryption key
-with open(encryption_key_path, 'wb') as key_file:
-    key_file.write(encryption_key)
+# Load the encryption key from the ENCRYPTION_KEY environment variable or the key file, or generate a new one
+encryption_key = load_key()
+if encryption_key is None:
+    encryption_key = generate_key()
+    # Save the encryption key
+    store_key(encryption_key)
 
 # Encrypt the sender_email and sender_password
-encrypted_sender_email = encrypt_data(sender_email.encode(), encryption_key)
-encrypted_sender_password = encrypt_data(sender_password.encode(), encryption_key)
+encrypted_sender_email, encrypted_sender_password = encrypt_many(
+    (sender_email.encode(), sender_password.encode()), encryption_key)
 
-# Delete the existing directory if it exists
-if os.path.exists(UPLOAD_FOLDER):
-    shutil.rmtree(UPLOAD_FOLDER)
-
-# Create a new directory
-os.makedirs(UPLOAD_FOLDER)
+# Create the uploads directory if it doesn't exist; every upload gets its own temporary directory inside it
+os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 # Set the permission to 777
 os.chmod(UPLOAD_FOLDER, 0o777)
@@ -55,25 +53,28 @@ def upload_file():
         return redirect(request.url)
     if file and allowed_file(file.filename):
         filename = secure_filename(file.filename)
-        # Save the uploaded file to the uploads folder
-        file_path = os.path.join(UPLOAD_FOLDER, filename)
-        file.save(file_path)
-        
-        # Check file type after upload
-        if filename.endswith('.c') or filename.endswith('.h'):
-            # Analyze the C++ script
-            analyzer = ScriptAnalyzer(file_path, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key)
-            try:
-                analyzer.run_analysis()
-                # Remove all handlers from the logger
-                for handler in logging.root.handlers[:]:
-                    logging.root.removeHandler(handler)
-                flash('File successfully uploaded and analyzed. Email sent successfully')
-            except Exception as e:
-                flash(f'Error analyzing the C++ script and sending email: {str(e)}', 'error')
-        else:
-            flash('File Types Allowed are .c, .h', 'error')
-            
+        # Save the uploaded file to its own directory in the uploads folder, removed once it has been analyzed
+        with tempfile.TemporaryDirectory(dir=UPLOAD_FOLDER) as upload_dir:
+            file_path = os.path.join(upload_dir, filename)
+            file.save(file_path)
+
+            # Check file type after upload
+            if filename.endswith('.c') or filename.endswith('.h'):
+                # Analyze the C++ script
+                analyzer = ScriptAnalyzer(file_path, recipient_email, encrypted_sender_email, encrypted_sender_password, encryption_key, LOG_FOLDER)
+                try:
+                    analyzer.run_analysis()
+                    # run_analysis logs its own errors, so the log is the only record of a failure
+                    if analyzer.error_count:
+                        flash('Error analyzing the C++ script and sending email. The analysis log was kept on the server', 'error')
+                    else:
+                        os.remove(analyzer.log_file)
+                        flash('File successfully uploaded and analyzed. Email sent successfully')
+                except Exception as e:
+                    flash(f'Error analyzing the C++ script and sending email: {str(e)}', 'error')
+            else:
+                flash('File Types Allowed are .c, .h', 'error')
+
         return redirect(url_for('index'))
     else:
         flash('Allowed file types are .c, .h', 'error')
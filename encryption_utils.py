@@ -1,39 +1,75 @@
 import os
+import logging
+from pathlib import Path
+from functools import lru_cache
 from cryptography.fernet import Fernet
 
+# Module logger; the module-level logging helpers would configure the root logger on first use
+logger = logging.getLogger(__name__)
+
+# The key file lives next to this module
+KEY_FOLDER = Path(__file__).resolve().parent
+KEY_PATH = KEY_FOLDER / 'encryption.key'
+
+# Environment variable that can supply the key instead of the key file
+KEY_ENV_VAR = 'ENCRYPTION_KEY'
+
+# Key read from the environment or KEY_PATH, or written to KEY_PATH, by this process
+cached_key = None
+
 def generate_key():
     return Fernet.generate_key()
 
+@lru_cache(maxsize=32)
+def get_cipher_suite(key):
+    # Build the Fernet instance once per key; it keeps no per-message state, so it can be shared
+    return Fernet(key)
+
 def encrypt_data(data, key):
-    cipher_suite = Fernet(key)
+    cipher_suite = get_cipher_suite(key)
     encrypted_data = cipher_suite.encrypt(data)
     return encrypted_data
 
 def decrypt_data(encrypted_data, key):
-    cipher_suite = Fernet(key)
+    cipher_suite = get_cipher_suite(key)
     decrypted_data = cipher_suite.decrypt(encrypted_data)
     return decrypted_data
 
+def encrypt_many(data_items, key):
+    # Encrypt several values with a single cipher suite lookup
+    cipher_suite = get_cipher_suite(key)
+    return [cipher_suite.encrypt(data) for data in data_items]
+
+def store_key(key):
+    global cached_key
+    KEY_PATH.write_bytes(key)
+    cached_key = key  # Later load_key calls return this key without reading the file
+    logger.info("Key saved to: %s", KEY_PATH)
+
 def save_key():
-    key = generate_key()
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    key_path = os.path.join(current_dir, 'encryption.key')
-    with open(key_path, 'wb') as key_file:
-        key_file.write(key)
-    print("Key saved to:", key_path)
+    store_key(generate_key())
 
 
 def load_key():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    key_path = os.path.join(current_dir, 'encryption.key')
-    print("Current directory:", current_dir)
-    print("Key path:", key_path)
+    global cached_key
+    # The key is only looked up once per process
+    if cached_key is not None:
+        return cached_key
+    # A key in the environment takes precedence over the key file
+    env_key = os.getenv(KEY_ENV_VAR)
+    if env_key:
+        cached_key = env_key.encode()
+        return cached_key
+    logger.debug("Current directory: %s", KEY_FOLDER)
+    logger.debug("Key path: %s", KEY_PATH)
     try:
-        with open(key_path, 'rb') as key_file:
-            return key_file.read()
+        cached_key = KEY_PATH.read_bytes()
+        return cached_key
     except FileNotFoundError:
-        print("Key file not found.")
+        logger.warning("Key file not found: %s", KEY_PATH)
         return None
 
-save_key()
-load_key()
+if __name__ == "__main__":
+    # Running this module directly provisions a new key file and reports where it was saved
+    logging.basicConfig(level=logging.INFO)
+    save_key()